@@ -1,5 +1,7 @@
 import time
 import json
+import gc
+import traceback
 from adafruit_matrixportal.matrix import Matrix
 from adafruit_matrixportal.network import Network
 import displayio
@@ -7,6 +9,7 @@ import terminalio
 from adafruit_display_text import label, bitmap_label
 import adafruit_display_text.scrolling_label as scrolling_label
 import board
+from adafruit_ticks import ticks_ms, ticks_diff
 
 class TrainTimeParser:
     """
@@ -22,6 +25,10 @@ class TrainTimeParser:
         self.current_utc_time = None
         self.weather_data = None
         self.secrets = secrets
+        # One-item caches of (timezone string -> offset seconds); every train
+        # in a response, and every network time string, shares one offset
+        self._tz_cache = (None, None, None)  # (sign, "hh:mm", seconds)
+        self._local_tz_cache = (None, None)
 
     def setup_display(self):
         """Initialize the LED matrix display"""
@@ -89,13 +96,17 @@ class TrainTimeParser:
                 second = int(float(second_float))
 
                 # Create local timestamp
-                local_time = time.mktime((year, month, day, hour, minute, second, 0, 0, -1))
-
-                # Parse timezone offset (-0800 means UTC-8)
-                tz_sign = 1 if tz_offset_str[0] == '+' else -1
-                tz_hours = int(tz_offset_str[1:3])
-                tz_minutes = int(tz_offset_str[3:5])
-                tz_offset_seconds = tz_sign * (tz_hours * 3600 + tz_minutes * 60)
+                local_time = self._days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+
+                # Parse timezone offset (-0800 means UTC-8), reusing the last result
+                if tz_offset_str == self._local_tz_cache[0]:
+                    tz_offset_seconds = self._local_tz_cache[1]
+                else:
+                    tz_sign = 1 if tz_offset_str[0] == '+' else -1
+                    tz_hours = int(tz_offset_str[1:3])
+                    tz_minutes = int(tz_offset_str[3:5])
+                    tz_offset_seconds = tz_sign * (tz_hours * 3600 + tz_minutes * 60)
+                    self._local_tz_cache = (tz_offset_str, tz_offset_seconds)
 
                 # Convert to UTC
                 self.current_utc_time = local_time - tz_offset_seconds
@@ -110,15 +121,15 @@ class TrainTimeParser:
 
         return self.current_utc_time
 
-    def parse_iso8601_to_utc(self, time_str):
+    def _parse_iso8601_fields(self, time_str):
         """
-        Parse ISO 8601 time string and convert to UTC Unix timestamp.
+        Split an ISO 8601 time string into its numeric fields.
 
         Args:
             time_str: ISO 8601 string like "2026-01-07T14:33:01-05:00"
 
         Returns:
-            Unix timestamp in UTC
+            tuple (year, month, day, hour, minute, second, tz_offset_seconds)
         """
         # Split into datetime and timezone parts
         if '+' in time_str:
@@ -136,12 +147,78 @@ class TrainTimeParser:
         year, month, day = map(int, date_part.split('-'))
         hour, minute, second = map(int, time_part.split(':'))
 
-        # Parse timezone offset
-        tz_hours, tz_minutes = map(int, tz_part.split(':'))
-        tz_offset_seconds = tz_sign * (tz_hours * 3600 + tz_minutes * 60)
+        # Parse timezone offset, reusing the last result (all trains share one)
+        cache = self._tz_cache
+        if tz_part == cache[1] and tz_sign == cache[0]:
+            tz_offset_seconds = cache[2]
+        else:
+            tz_hours, tz_minutes = map(int, tz_part.split(':'))
+            tz_offset_seconds = tz_sign * (tz_hours * 3600 + tz_minutes * 60)
+            self._tz_cache = (tz_sign, tz_part, tz_offset_seconds)
+
+        return year, month, day, hour, minute, second, tz_offset_seconds
+
+    @staticmethod
+    def _days_from_civil(year, month, day):
+        """
+        Days from 1970-01-01 to a proleptic Gregorian date, in integer math.
+
+        Howard Hinnant's days_from_civil algorithm; replaces time.mktime(),
+        which marshals a 9-tuple and applies DST rules on every call.
+        """
+        year -= month <= 2
+        era = year // 400
+        yoe = year - era * 400
+        doy = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+        return era * 146097 + doe - 719468
+
+    @staticmethod
+    def _civil_from_days(days):
+        """
+        Inverse of _days_from_civil: (year, month, day) for days since 1970-01-01.
+        """
+        days += 719468
+        era = days // 146097
+        doe = days - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        return yoe + era * 400 + (month <= 2), month, day
+
+    def _format_iso8601_prefix(self, utc_timestamp, tz_offset_seconds):
+        """
+        Format a UTC timestamp as local ISO 8601 date and time, without offset.
+
+        Args:
+            utc_timestamp: Unix timestamp in UTC (whole seconds)
+            tz_offset_seconds: Offset of the wanted local time from UTC
+
+        Returns:
+            string like "2026-01-07T14:33:01"
+        """
+        days, seconds = divmod(utc_timestamp + tz_offset_seconds, 86400)
+        year, month, day = self._civil_from_days(days)
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
+        return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
+
+    def parse_iso8601_to_utc(self, time_str):
+        """
+        Parse ISO 8601 time string and convert to UTC Unix timestamp.
+
+        Args:
+            time_str: ISO 8601 string like "2026-01-07T14:33:01-05:00"
+
+        Returns:
+            Unix timestamp in UTC
+        """
+        year, month, day, hour, minute, second, tz_offset_seconds = self._parse_iso8601_fields(time_str)
 
         # Create timestamp in local time (as specified by the timezone)
-        local_timestamp = time.mktime((year, month, day, hour, minute, second, 0, 0, -1))
+        local_timestamp = self._days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
 
         # Convert to UTC by subtracting the timezone offset
         utc_timestamp = local_timestamp - tz_offset_seconds
@@ -156,16 +233,59 @@ class TrainTimeParser:
             station_id: Station ID (default "A31")
 
         Returns:
-            JSON response as dict
+            JSON response as dict, trimmed by _trim_train_data()
         """
         url = f"https://api.wheresthefuckingtrain.com/by-id/{station_id}"
         print(f"Fetching: {url}")
 
+        return self._trim_train_data(self._fetch_json(url))
+
+    def _fetch_json(self, url):
+        """
+        GET a URL and decode its JSON body.
+
+        Response.json() parses straight from the socket rather than
+        buffering the whole body first, which keeps peak memory lowest.
+        The response is closed even if decoding fails, so the socket is
+        not left open on error paths.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            JSON response as dict
+        """
         # Use network.fetch() to get the response object
         response = self.network.fetch(url)
+        try:
+            return response.json()
+        finally:
+            response.close()
+
+    def _trim_train_data(self, data):
+        """
+        Keep only the parts of a train API response that parse_train_times() reads.
+
+        The full payload carries station names, locations, stops and other
+        metadata; dropping our reference to it right away lets that be
+        collected before the per-train parsing allocates.
+
+        Args:
+            data: JSON dict from the train API
 
-        # The response object has a json() method
-        return response.json()
+        Returns:
+            dict shaped like the API response with just the first station's
+            'N' and 'S' train lists
+        """
+        stations = data.get('data')
+        if not stations:
+            return {'data': []}
+
+        station_data = stations[0]
+        return {'data': [{
+            'N': station_data.get('N', []),
+            'S': station_data.get('S', [])
+        }]}
 
     def fetch_weather_data(self, city="New York,US"):
         """
@@ -188,41 +308,69 @@ class TrainTimeParser:
             url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=imperial"
             print(f"Fetching weather from OpenWeather API...")
 
-            response = self.network.fetch(url)
-            data = response.json()
-
-            # Extract weather description and temperature
-            weather_list = data.get('weather', [{}])
-            if weather_list and len(weather_list) > 0:
-                description = str(weather_list[0].get('description', 'Unknown'))
-                # Manually capitalize first letter of each word
-                words = description.split(' ')
-                capitalized_words = []
-                for word in words:
-                    if len(word) > 0:
-                        # Manually capitalize: uppercase first char, lowercase rest
-                        cap_word = word[0].upper() + word[1:].lower() if len(word) > 1 else word[0].upper()
-                        capitalized_words.append(cap_word)
-                description = ' '.join(capitalized_words)
-            else:
-                description = 'Unknown'
-
-            temp_f = int(data.get('main', {}).get('temp', 0))
-
-            self.weather_data = {
-                'description': description,
-                'temp_f': temp_f
-            }
-
-            print(f"Weather: {description}, {temp_f}°F")
-            return self.weather_data
+            return self._parse_weather(self._fetch_json(url))
 
         except Exception as e:
             print(f"Error fetching weather: {e}")
-            import traceback
             traceback.print_exception(e, e, e.__traceback__)
             return {'description': 'Unknown', 'temp_f': 0}
 
+    def _parse_weather(self, data):
+        """
+        Extract description and temperature from an OpenWeather response.
+
+        Args:
+            data: JSON dict from the OpenWeather current weather API
+
+        Returns:
+            dict with 'description' and 'temp_f' keys
+        """
+        # Extract weather description and temperature
+        weather_list = data.get('weather', [{}])
+        if weather_list and len(weather_list) > 0:
+            description = str(weather_list[0].get('description', 'Unknown'))
+            # Capitalize first letter of each word (CircuitPython's str
+            # has no title()/capitalize(), so do it in one join)
+            description = ' '.join(w[0].upper() + w[1:].lower() for w in description.split())
+        else:
+            description = 'Unknown'
+
+        temp_f = int(data.get('main', {}).get('temp', 0))
+
+        self.weather_data = {
+            'description': description,
+            'temp_f': temp_f
+        }
+
+        print(f"Weather: {description}, {temp_f}°F")
+        return self.weather_data
+
+    def fetch_combined_data(self, url):
+        """
+        Fetch train and weather data together from a single user-run endpoint.
+
+        Neither upstream API can batch, and requests on the ESP32 co-processor
+        are serial, so when both are due a small proxy that performs both
+        fetches server-side saves one full round trip.
+
+        Args:
+            url: Endpoint returning {"trains": <train API JSON>,
+                 "weather": <OpenWeather current weather JSON>}
+
+        Returns:
+            tuple (train JSON dict, weather dict with 'description' and 'temp_f')
+        """
+        print(f"Fetching: {url}")
+        data = self._fetch_json(url)
+
+        try:
+            weather = self._parse_weather(data.get('weather', {}))
+        except Exception as e:
+            print(f"Error parsing weather: {e}")
+            weather = {'description': 'Unknown', 'temp_f': 0}
+
+        return self._trim_train_data(data.get('trains', {})), weather
+
     def parse_train_times(self, json_response, min_minutes=5):
         """
         Parse train API response and return trains departing in more than min_minutes.
@@ -233,14 +381,14 @@ class TrainTimeParser:
 
         Returns:
             dict with 'northbound' and 'southbound' keys, each containing
-            a list of dicts with 'route', 'minutes_until', and 'time' keys
+            parallel 'routes' and 'minutes' lists (one entry per train)
         """
         # Get current UTC time from Adafruit IO
         current_utc = self.get_current_time_utc()
 
         result = {
-            'northbound': [],
-            'southbound': []
+            'northbound': {'routes': [], 'minutes': []},
+            'southbound': {'routes': [], 'minutes': []}
         }
 
         # Extract the first station data
@@ -249,34 +397,51 @@ class TrainTimeParser:
 
         station_data = json_response['data'][0]
 
-        # Process Northbound trains
-        if 'N' in station_data:
-            for train in station_data['N']:
-                train_utc = self.parse_iso8601_to_utc(train['time'])
-                minutes = int((train_utc - current_utc) / 60)
-
-                if minutes > min_minutes:
-                    result['northbound'].append({
-                        'route': train['route'],
-                        'minutes_until': minutes,
-                        'time': train['time']
-                    })
-
-        # Process Southbound trains
-        if 'S' in station_data:
-            for train in station_data['S']:
-                train_utc = self.parse_iso8601_to_utc(train['time'])
+        # UTC timestamp of midnight for the (date, offset) last seen; trains
+        # on that same day are then plain seconds-of-day arithmetic, and the
+        # day number is only worked out again when the date rolls over
+        day_key = None
+        day_start_utc = 0
+
+        # A train only qualifies once it is (min_minutes + 1) whole minutes
+        # out. ISO 8601 strings with the same offset sort chronologically, so
+        # format that cutoff in the trains' offset and skip parsing earlier
+        # trains with a plain string compare on the "YYYY-MM-DDTHH:MM:SS" part.
+        prefilter = min_minutes >= 0
+        cutoff_utc = current_utc + (min_minutes + 1) * 60
+        cutoff_utc = int(cutoff_utc) + (int(cutoff_utc) < cutoff_utc)
+        cutoff_suffix = None
+        cutoff_prefix = ''
+
+        for direction, key in (('N', 'northbound'), ('S', 'southbound')):
+            if direction not in station_data:
+                continue
+            routes = result[key]['routes']
+            mins = result[key]['minutes']
+            for train in station_data[direction]:
+                time_str = train['time']
+                if prefilter:
+                    if time_str[19:] != cutoff_suffix:
+                        cutoff_suffix = time_str[19:]
+                        tz_offset = self._parse_iso8601_fields(time_str)[6]
+                        cutoff_prefix = self._format_iso8601_prefix(cutoff_utc, tz_offset)
+                    if time_str[:19] < cutoff_prefix:
+                        continue
+
+                year, month, day, hour, minute, second, tz_offset = self._parse_iso8601_fields(time_str)
+                if (year, month, day, tz_offset) != day_key:
+                    day_key = (year, month, day, tz_offset)
+                    day_start_utc = self._days_from_civil(year, month, day) * 86400 - tz_offset
+                train_utc = day_start_utc + hour * 3600 + minute * 60 + second
                 minutes = int((train_utc - current_utc) / 60)
 
                 if minutes > min_minutes:
-                    result['southbound'].append({
-                        'route': train['route'],
-                        'minutes_until': minutes,
-                        'time': train['time']
-                    })
+                    routes.append(train['route'])
+                    mins.append(minutes)
 
         return result
 
+
     def get_next_trains_by_route(self, parsed_data):
         """
         Organize parsed train data by route.
@@ -289,46 +454,50 @@ class TrainTimeParser:
         """
         routes = {}
 
-        # Process northbound
-        for train in parsed_data['northbound']:
-            route = train['route']
-            if route not in routes:
-                routes[route] = {'northbound': None, 'southbound': None}
-            if routes[route]['northbound'] is None:
-                routes[route]['northbound'] = train['minutes_until']
-
-        # Process southbound
-        for train in parsed_data['southbound']:
-            route = train['route']
-            if route not in routes:
-                routes[route] = {'northbound': None, 'southbound': None}
-            if routes[route]['southbound'] is None:
-                routes[route]['southbound'] = train['minutes_until']
+        for key in ('northbound', 'southbound'):
+            direction = parsed_data[key]
+            for route, minutes in zip(direction['routes'], direction['minutes']):
+                if route not in routes:
+                    routes[route] = {'northbound': None, 'southbound': None}
+                if routes[route][key] is None:
+                    routes[route][key] = minutes
 
         return routes
 
 
-def create_degree_symbol():
+# 3x3 bitmap for the degree symbol, drawn once and shared by every TileGrid
+_DEGREE_BITMAP = displayio.Bitmap(3, 3, 2)
+# Draw a small circle (ring)
+# Top and bottom rows: middle pixel only
+_DEGREE_BITMAP[1, 0] = 1
+_DEGREE_BITMAP[1, 2] = 1
+# Middle row: left and right pixels only (hollow)
+_DEGREE_BITMAP[0, 1] = 1
+_DEGREE_BITMAP[2, 1] = 1
+
+# color -> Palette for the degree symbol
+_DEGREE_PALETTES = {}
+
+
+def create_degree_symbol(color=0xFFFFFF):
     """
     Create a small bitmap for the degree symbol (°).
-    Returns a displayio.TileGrid with a 3x3 pixel circle.
-    """
-    # Create a 3x3 bitmap for the degree symbol
-    bitmap = displayio.Bitmap(3, 3, 2)
-    palette = displayio.Palette(2)
-    palette[0] = 0x000000  # Transparent
-    palette[1] = 0xFFFFFF  # White (will be colored by parent group)
-    palette.make_transparent(0)
 
-    # Draw a small circle (ring)
-    # Top and bottom rows: middle pixel only
-    bitmap[1, 0] = 1
-    bitmap[1, 2] = 1
-    # Middle row: left and right pixels only (hollow)
-    bitmap[0, 1] = 1
-    bitmap[2, 1] = 1
+    Args:
+        color: Color of the symbol (default white)
+
+    Returns:
+        displayio.TileGrid with a 3x3 pixel circle
+    """
+    palette = _DEGREE_PALETTES.get(color)
+    if palette is None:
+        palette = displayio.Palette(2)
+        palette[0] = 0x000000  # Transparent
+        palette[1] = color
+        palette.make_transparent(0)
+        _DEGREE_PALETTES[color] = palette
 
-    return displayio.TileGrid(bitmap, pixel_shader=palette)
+    return displayio.TileGrid(_DEGREE_BITMAP, pixel_shader=palette)
 
 
 # MTA Route colors (official colors)
@@ -358,41 +527,82 @@ MTA_ROUTE_COLORS = {
     'S': 0x808183,  # Gray (Shuttle)
 }
 
-
-def create_route_badge(route, scale=1):
+def _draw_badge_bitmap(size=12):
     """
-    Create a displayio group with a route badge (letter in colored circle).
+    Draw the filled circle used behind every route badge.
+
+    The bitmap only holds palette indices, so one copy serves all routes.
 
     Args:
-        route: Route letter/number (e.g., 'A', 'C', 'E', 'L')
-        scale: Scale factor (default 1)
+        size: Width and height in pixels (default 12 - even number for centering)
 
     Returns:
-        displayio.Group containing the badge
+        displayio.Bitmap with the circle at index 1 and background at index 0
     """
-    group = displayio.Group(scale=scale)
+    bitmap = displayio.Bitmap(size, size, 2)
+
+    # Draw a filled circle
+    center = size / 2.0
+    for y in range(size):
+        for x in range(size):
+            dx = x - center + 0.5
+            dy = y - center + 0.5
+            if dx*dx + dy*dy <= (center)**2:
+                bitmap[x, y] = 1
+
+    return bitmap
 
-    # Get route color
-    color = MTA_ROUTE_COLORS.get(route, 0xFFFFFF)
 
-    # Create a colored circle bitmap (12x12 pixels - even number for centering)
-    circle_size = 12
-    bitmap = displayio.Bitmap(circle_size, circle_size, 2)
+def _make_badge_palette(color):
+    """Create a two-color badge palette: transparent background, route color."""
     palette = displayio.Palette(2)
     palette[0] = 0x000000  # Transparent/black
     palette[1] = color  # Route color
     palette.make_transparent(0)  # Make background transparent
+    return palette
 
-    # Draw a filled circle
-    center = circle_size / 2.0
-    for y in range(circle_size):
-        for x in range(circle_size):
-            dx = x - center + 0.5
-            dy = y - center + 0.5
-            if dx*dx + dy*dy <= (center)**2:
-                bitmap[x, y] = 1
 
-    tile_grid = displayio.TileGrid(bitmap, pixel_shader=palette)
+def _build_route_palettes():
+    """
+    Create one badge palette per route, shared between routes of the same
+    color (e.g. A/C/E all use 0x0039A6).
+
+    Returns:
+        dict mapping route to displayio.Palette
+    """
+    by_color = {}
+    palettes = {}
+    for route, color in MTA_ROUTE_COLORS.items():
+        if color not in by_color:
+            by_color[color] = _make_badge_palette(color)
+        palettes[route] = by_color[color]
+    return palettes
+
+
+# Badge pixel data and palettes never change, so build them once at import
+_BADGE_BITMAP = _draw_badge_bitmap()
+_ROUTE_PALETTES = _build_route_palettes()
+# Routes without an official color get a white badge
+_DEFAULT_BADGE_PALETTE = _make_badge_palette(0xFFFFFF)
+
+
+def create_route_badge(route, scale=1):
+    """
+    Create a displayio group with a route badge (letter in colored circle).
+
+    Args:
+        route: Route letter/number (e.g., 'A', 'C', 'E', 'L')
+        scale: Scale factor (default 1)
+
+    Returns:
+        displayio.Group containing the badge
+    """
+    group = displayio.Group(scale=scale)
+
+    # A TileGrid/Group can only have one parent, so those are created per
+    # badge around the shared bitmap and route palette
+    palette = _ROUTE_PALETTES.get(route, _DEFAULT_BADGE_PALETTE)
+    tile_grid = displayio.TileGrid(_BADGE_BITMAP, pixel_shader=palette)
     group.append(tile_grid)
 
     # Add the route letter/number centered with BLACK text
@@ -414,188 +624,115 @@ def format_train_text_with_badges(trains, direction):
     Format train data for display with route badges.
 
     Args:
-        trains: List of train dicts with 'route' and 'minutes_until'
+        trains: One direction from parse_train_times(), with parallel
+            'routes' and 'minutes' lists
         direction: "N" or "S" for display
 
     Returns:
         List of tuples (route, times_string) for each route
     """
-    if not trains:
+    if not trains['routes']:
         return []
 
-    # Group by route for compact display
+    # Group by route for compact display in one sweep - trains arrive in time
+    # order, so keep just the first 2 times per route to save memory
     route_times = {}
-    for train in trains:
-        route = train['route']
-        mins = train['minutes_until']
-        if route not in route_times:
-            route_times[route] = []
-        route_times[route].append(mins)
-
-    # Create list of (route, times) tuples - LIMIT to first 2 times per route to save memory
+    order = []
+    for route, mins in zip(trains['routes'], trains['minutes']):
+        times = route_times.get(route)
+        if times is None:
+            route_times[route] = [str(mins)]
+            order.append(route)
+        elif len(times) < 2:  # Only show 2 times instead of 3
+            times.append(str(mins))
+
+    # Create list of (route, times) tuples, alphabetical by route
+    order.sort()
     result = []
-    for route in sorted(route_times.keys()):
-        times = ','.join(str(t) for t in route_times[route][:2])  # Only show 2 times instead of 3
-        result.append((route, times))
+    for route in order:
+        result.append((route, ','.join(route_times[route])))
 
     return result
 
 
-def create_scrolling_display(parser, trains, weather=None):
+def build_display(parser):
     """
-    Create and update the scrolling display with route badges and weather.
+    Create the display groups once; update_display() fills them in.
+
+    Handles to the labels that change are stored on the parser so each poll
+    only has to rewrite text and positions instead of rebuilding the tree.
+    Line text uses bitmap_label, which renders each string into a single
+    bitmap that is cheaper to composite every scroll frame than a glyph group.
 
     Args:
         parser: TrainTimeParser instance
-        trains: Parsed train data
-        weather: Weather data dict with 'description' and 'temp_f' (optional)
-    """
-    print(f"Northbound count: {len(trains['northbound'])}")
-    print(f"Southbound count: {len(trains['southbound'])}")
 
-    # Create a fresh display group
+    Returns:
+        tuple (north_scroll_group, south_scroll_group) for the scroll animation
+    """
     main_group = displayio.Group()
 
-    # Format data for north and south
-    north_data = format_train_text_with_badges(trains['northbound'], "N")
-    south_data = format_train_text_with_badges(trains['southbound'], "S")
-
     # Create southbound display (bottom half) - Downtown
     south_scroll_group = displayio.Group()
     south_scroll_group.y = 20
 
-    # Build the entire line: Downtown label, badges, times, then temperature
-    x_offset = 0
-
     # Add "Downtown: " label
-    s_label = label.Label(
+    s_label = bitmap_label.Label(
         terminalio.FONT,
         text="Downtown: ",
         color=0x6BB6FF,
-        x=x_offset,
+        x=0,
         y=4
     )
     south_scroll_group.append(s_label)
-    x_offset += len("Downtown: ") * 6
-
-    # Add each route badge and times
-    for route, times in south_data:
-        # Add badge
-        badge = create_route_badge(route)
-        badge.x = x_offset
-        badge.y = -2
-        south_scroll_group.append(badge)
-        x_offset += 15  # Badge width (12) + 3 pixels spacing
-
-        # Add times
-        times_label = label.Label(
-            terminalio.FONT,
-            text=f"{times} ",
-            color=0x6BB6FF,
-            x=x_offset,
-            y=4
-        )
-        south_scroll_group.append(times_label)
-        x_offset += len(times) * 6 + 6
-
-    # Add temperature at the end if available with custom degree symbol
-    if weather:
-        # Add some spacing before temperature
-        x_offset += 12
-
-        # Add temperature number
-        temp_label = label.Label(
-            terminalio.FONT,
-            text=f"{weather['temp_f']}",
-            color=0x6BB6FF,
-            x=x_offset,
-            y=4
-        )
-        south_scroll_group.append(temp_label)
-        x_offset += len(str(weather['temp_f'])) * 6
-
-        # Add degree symbol bitmap
-        degree_symbol = create_degree_symbol()
-        degree_group = displayio.Group()
-        degree_group.append(degree_symbol)
-        degree_group.x = x_offset
-        degree_group.y = 1  # Raise it up to be superscript-like
 
-        # Color the degree symbol
-        for i in range(len(degree_symbol.pixel_shader)):
-            if not degree_symbol.pixel_shader.is_transparent(i):
-                degree_symbol.pixel_shader[i] = 0x6BB6FF
-
-        south_scroll_group.append(degree_group)
-        x_offset += 4  # Width of degree symbol + small space
+    # Temperature with custom degree symbol, shown at the end when available
+    temp_label = bitmap_label.Label(
+        terminalio.FONT,
+        text="",
+        color=0x6BB6FF,
+        y=4
+    )
+    south_scroll_group.append(temp_label)
 
-        # Add "F"
-        f_label = label.Label(
-            terminalio.FONT,
-            text="F",
-            color=0x6BB6FF,
-            x=x_offset,
-            y=4
-        )
-        south_scroll_group.append(f_label)
-        x_offset += len("F") * 6
+    degree_group = displayio.Group()
+    degree_group.append(create_degree_symbol(0x6BB6FF))
+    degree_group.y = 1  # Raise it up to be superscript-like
+    south_scroll_group.append(degree_group)
 
-    south_width = x_offset
+    f_label = bitmap_label.Label(
+        terminalio.FONT,
+        text="F",
+        color=0x6BB6FF,
+        y=4
+    )
+    south_scroll_group.append(f_label)
 
     # Create northbound display (top half) - Uptown
     north_scroll_group = displayio.Group()
     north_scroll_group.y = 4
 
-    # Build the entire line: Uptown label, badges, times, then description
-    x_offset = 0
-
     # Add "Uptown: " label
-    n_label = label.Label(
+    n_label = bitmap_label.Label(
         terminalio.FONT,
         text="Uptown: ",
         color=0xFF8C40,
-        x=x_offset,
+        x=0,
         y=4
     )
     north_scroll_group.append(n_label)
-    x_offset += len("Uptown: ") * 6
-
-    # Add each route badge and times
-    for route, times in north_data:
-        # Add badge
-        badge = create_route_badge(route)
-        badge.x = x_offset
-        badge.y = -2
-        north_scroll_group.append(badge)
-        x_offset += 15  # Badge width (12) + 3 pixels spacing
 
-        # Add times
-        times_label = label.Label(
-            terminalio.FONT,
-            text=f"{times} ",
-            color=0xFF8C40,
-            x=x_offset,
-            y=4
-        )
-        north_scroll_group.append(times_label)
-        x_offset += len(times) * 6 + 6
-
-    # Add weather description at the end if available
-    if weather:
-        # Add some spacing before description
-        x_offset += 12
-
-        desc_label = label.Label(
-            terminalio.FONT,
-            text=f"{weather['description']}",
-            color=0xFF8C40,
-            x=x_offset,
-            y=4
-        )
-        north_scroll_group.append(desc_label)
-        x_offset += len(weather['description']) * 6
+    # Weather description, shown at the end when available
+    desc_label = bitmap_label.Label(
+        terminalio.FONT,
+        text="",
+        color=0xFF8C40,
+        y=4
+    )
+    north_scroll_group.append(desc_label)
 
-    north_width = x_offset
+    for item in (temp_label, degree_group, f_label, desc_label):
+        item.hidden = True
 
     # Wrap in container groups for scrolling
     north_container = displayio.Group()
@@ -608,12 +745,148 @@ def create_scrolling_display(parser, trains, weather=None):
     main_group.append(south_container)
     main_group.append(north_container)
 
+    parser._scroll_groups = {'N': north_scroll_group, 'S': south_scroll_group}
+    # route -> (badge, times_label), kept (hidden) when a route drops out
+    parser._route_items = {'N': {}, 'S': {}}
+    parser._weather_items = {
+        'N': desc_label,
+        'S': (temp_label, degree_group, f_label)
+    }
+
     # Show the group
     parser.display.root_group = main_group
+
+    return north_scroll_group, south_scroll_group
+
+
+# Pixel widths of fixed text in terminalio.FONT (6 pixels per character)
+_DOWNTOWN_W = 10 * 6  # "Downtown: "
+_UPTOWN_W = 8 * 6  # "Uptown: "
+_F_W = 1 * 6  # "F"
+
+
+def _set_label_text(text_label, text):
+    """Set a label's text only if it changed, avoiding a needless re-layout."""
+    if text_label.text != text:
+        text_label.text = text
+
+
+def _layout_routes(parser, direction, data, color, x_offset):
+    """
+    Position the badge and times label for each route in one display line.
+
+    Args:
+        parser: TrainTimeParser instance set up by build_display()
+        direction: "N" or "S"
+        data: Output from format_train_text_with_badges()
+        color: Text color for the times
+        x_offset: x position where the first badge starts
+
+    Returns:
+        x position just past the last route
+    """
+    scroll_group = parser._scroll_groups[direction]
+    items = parser._route_items[direction]
+    shown = set()
+
+    for route, times in data:
+        if route in items:
+            badge, times_label = items[route]
+        else:
+            badge = create_route_badge(route)
+            badge.y = -2
+            times_label = bitmap_label.Label(
+                terminalio.FONT,
+                text="",
+                color=color,
+                y=4
+            )
+            scroll_group.append(badge)
+            scroll_group.append(times_label)
+            items[route] = (badge, times_label)
+        shown.add(route)
+
+        badge.x = x_offset
+        badge.hidden = False
+        x_offset += 15  # Badge width (12) + 3 pixels spacing
+
+        _set_label_text(times_label, times + " ")
+        times_label.x = x_offset
+        times_label.hidden = False
+        x_offset += len(times) * 6 + 6
+
+    # Hide routes with no trains this time round
+    for route, (badge, times_label) in items.items():
+        if route not in shown:
+            badge.hidden = True
+            times_label.hidden = True
+
+    return x_offset
+
+
+def update_display(parser, trains, weather=None):
+    """
+    Update the scrolling display with route badges and weather.
+
+    Args:
+        parser: TrainTimeParser instance set up by build_display()
+        trains: Parsed train data
+        weather: Weather data dict with 'description' and 'temp_f' (optional)
+
+    Returns:
+        tuple (north_width, south_width) of the content widths for animation
+    """
+    print(f"Northbound count: {len(trains['northbound']['routes'])}")
+    print(f"Southbound count: {len(trains['southbound']['routes'])}")
+
+    # Format data for north and south
+    north_data = format_train_text_with_badges(trains['northbound'], "N")
+    south_data = format_train_text_with_badges(trains['southbound'], "S")
+
+    # Southbound line: Downtown label, badges, times, then temperature
+    x_offset = _layout_routes(parser, "S", south_data, 0x6BB6FF, _DOWNTOWN_W)
+
+    temp_label, degree_group, f_label = parser._weather_items['S']
+    if weather:
+        # Add some spacing before temperature
+        x_offset += 12
+
+        temp_str = str(weather['temp_f'])
+        _set_label_text(temp_label, temp_str)
+        temp_label.x = x_offset
+        x_offset += len(temp_str) * 6
+
+        degree_group.x = x_offset
+        x_offset += 4  # Width of degree symbol + small space
+
+        f_label.x = x_offset
+        x_offset += _F_W
+
+    for item in (temp_label, degree_group, f_label):
+        item.hidden = not weather
+
+    south_width = x_offset
+
+    # Northbound line: Uptown label, badges, times, then description
+    x_offset = _layout_routes(parser, "N", north_data, 0xFF8C40, _UPTOWN_W)
+
+    desc_label = parser._weather_items['N']
+    if weather:
+        # Add some spacing before description
+        x_offset += 12
+
+        description = weather['description']
+        _set_label_text(desc_label, description)
+        desc_label.x = x_offset
+        x_offset += len(description) * 6
+
+    desc_label.hidden = not weather
+
+    north_width = x_offset
+
     parser.display.refresh()
 
-    # Return the scroll groups and their content widths for animation
-    return north_scroll_group, south_scroll_group, north_width, south_width, parser.display.width
+    return north_width, south_width
 
 
 # Example usage with secrets.py file:
@@ -624,7 +897,10 @@ secrets = {
     'ssid': 'your_wifi_ssid',
     'password': 'your_wifi_password',
     'aio_username': 'your_aio_username',
-    'aio_key': 'your_aio_key'
+    'aio_key': 'your_aio_key',
+    # Optional: endpoint returning {"trains": ..., "weather": ...} so both
+    # can be fetched in one request when the weather is due
+    'combined_url': 'https://example.com/subway?station=A31&city=New+York,US'
 }
 """
 
@@ -651,13 +927,17 @@ if __name__ == "__main__":
     parser.connect()
 
     # Track startup time for 20-minute timeout
-    startup_time = time.monotonic()
-    run_duration = 20 * 60  # 20 minutes in seconds
+    # Integer millisecond ticks avoid float math and precision loss
+    startup_time = ticks_ms()
+    run_duration = 20 * 60 * 1000  # 20 minutes in milliseconds
 
     # Initial fetch of both weather and trains
     print("\nFetching initial weather data...")
     weather = parser.fetch_weather_data("New York,US")
-    last_weather_update = time.monotonic()
+    last_weather_update = ticks_ms()
+
+    # Optional single endpoint for trains + weather
+    combined_url = secrets.get('combined_url')
 
     # Main loop
     north_group = None
@@ -666,11 +946,14 @@ if __name__ == "__main__":
     south_width = 0
     display_width = parser.display.width
 
+    # Refresh by hand from here on so the scroll loop sets the frame pacing
+    parser.display.auto_refresh = False
+
     while True:
         try:
             # Check if 20 minutes have elapsed
-            current_time = time.monotonic()
-            if current_time - startup_time >= run_duration:
+            current_time = ticks_ms()
+            if ticks_diff(current_time, startup_time) >= run_duration:
                 print("\n20 minutes elapsed - going dormant")
                 # Clear the display
                 blank_group = displayio.Group()
@@ -683,43 +966,55 @@ if __name__ == "__main__":
                 while True:
                     time.sleep(3600)  # Sleep indefinitely
 
-            # Check if we need to update weather (every 10 minutes = 600 seconds)
-            if current_time - last_weather_update >= 600:
-                print("\nFetching weather data...")
-                weather = parser.fetch_weather_data("New York,US")
-                last_weather_update = current_time
-
-            # Fetch and parse train data (every loop = every minute)
-            print("\nFetching train data...")
-            train_data = parser.fetch_train_data("A31")
+            # Only sweep the heap when it is running low - a full collection
+            # takes tens of ms and stalls the display
+            if gc.mem_free() < 20000:
+                gc.collect()
+
+            # Check if we need to update weather (every 10 minutes = 600000 ms)
+            weather_due = ticks_diff(current_time, last_weather_update) >= 600000
+
+            train_data = None
+            if weather_due and combined_url:
+                # Get trains and weather in one request
+                print("\nFetching train and weather data...")
+                try:
+                    train_data, weather = parser.fetch_combined_data(combined_url)
+                    last_weather_update = current_time
+                except Exception as e:
+                    # Don't let the optional endpoint block train updates
+                    print(f"Error fetching combined data: {e}, fetching separately")
+
+            if train_data is None:
+                if weather_due:
+                    print("\nFetching weather data...")
+                    weather = parser.fetch_weather_data("New York,US")
+                    last_weather_update = current_time
+
+                # Fetch train data (every loop = every minute)
+                print("\nFetching train data...")
+                train_data = parser.fetch_train_data("A31")
+
+            # Parse train data
             trains = parser.parse_train_times(train_data, min_minutes=5)
 
             # Limit trains to reduce memory usage - only keep first 4 trains per direction
-            trains['northbound'] = trains['northbound'][:4]
-            trains['southbound'] = trains['southbound'][:4]
+            for direction in trains.values():
+                direction['routes'] = direction['routes'][:4]
+                direction['minutes'] = direction['minutes'][:4]
 
             print("\nNorthbound trains (>5 min):")
-            for train in trains['northbound']:
-                print(f"  Route {train['route']}: {train['minutes_until']} min")
+            for route, mins in zip(trains['northbound']['routes'], trains['northbound']['minutes']):
+                print(f"  Route {route}: {mins} min")
 
             print("\nSouthbound trains (>5 min):")
-            for train in trains['southbound']:
-                print(f"  Route {train['route']}: {train['minutes_until']} min")
+            for route, mins in zip(trains['southbound']['routes'], trains['southbound']['minutes']):
+                print(f"  Route {route}: {mins} min")
 
-            # Only create display on first run, otherwise reuse
+            # Only create display on first run, then just update it in place
             if north_group is None:
-                # Create/update display with weather
-                north_group, south_group, north_width, south_width, display_width = create_scrolling_display(parser, trains, weather)
-            else:
-                # Just update the existing display with new data
-                # For now, recreate since updating is complex
-                # Free old groups first
-                north_group = None
-                south_group = None
-                import gc
-                gc.collect()  # Force garbage collection
-
-                north_group, south_group, north_width, south_width, display_width = create_scrolling_display(parser, trains, weather)
+                north_group, south_group = build_display(parser)
+            north_width, south_width = update_display(parser, trains, weather)
 
             # Manual scrolling animation - each line loops independently
             north_position = 0
@@ -740,10 +1035,10 @@ if __name__ == "__main__":
                     south_position = display_width
                 south_group.x = south_position
 
-                time.sleep(0.1)
+                # Waits until the next 10 FPS frame slot, then draws it
+                parser.display.refresh(target_frames_per_second=10)
 
         except Exception as e:
             print(f"Error: {e}")
-            import gc
             gc.collect()  # Try to free memory
             time.sleep(10)  # Wait before retrying